@@ -0,0 +1,23 @@
+# scripts/yaml_to_json.py
+"""
+config/sources.yaml -> config/sources.json
+CI에서 파이프라인 전에 실행. src.run.load_config는 yaml보다 새 json이 있으면 json을 먼저 읽는다.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+
+def main(src: str = "config/sources.yaml", dst: str = "config/sources.json") -> None:
+    data = yaml.safe_load(Path(src).read_text(encoding="utf-8")) or {}
+    # JSON object keys must be strings (tiers: 1/2/3 are ints in yaml); infer_tier int()s them back
+    Path(dst).write_text(json.dumps(data, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+    print(f"[OK] {src} -> {dst}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -100,9 +100,7 @@ def collect_from_rss(url: str, source_name: str, target_date: str) -> list[dict[
     out: list[dict[str, str]] = []
 
     for e in getattr(feed, "entries", []):
-        title = (e.get("title") or "").strip()
-        link = normalize_url((e.get("link") or "").strip())
-
+        # date filter first: off-date entries skip URL normalization and dict building
         dt = _parse_date(e)
         if not dt:
             continue
@@ -111,6 +109,9 @@ def collect_from_rss(url: str, source_name: str, target_date: str) -> list[dict[
         if published_at != target_date:
             continue
 
+        title = (e.get("title") or "").strip()
+        link = normalize_url((e.get("link") or "").strip())
+
         description = (e.get("summary") or e.get("description") or "").strip()
         description = re.sub(r"\s+", " ", description)
 
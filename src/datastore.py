@@ -40,9 +40,8 @@ def upsert_master_csv(data_dir: Path, items: list[dict[str, Any]]) -> Path:
     # 2) 신규/업데이트 병합
     for it in items:
         uid = _uid_from_item(it)
-        summ = it.get("summary_3_sentences") or ["", "", ""]
-        while len(summ) < 3:
-            summ.append("")
+        summ = (it.get("summary_3_sentences") or [])[:3]
+        summ += [""] * (3 - len(summ))
         comps = it.get("companies") or []
 
         existing[uid] = {
@@ -114,9 +113,8 @@ def write_daily_csv(out_dir: Path, date_str: str, items: list[dict[str, Any]]) -
         w = csv.DictWriter(f, fieldnames=fields)
         w.writeheader()
         for it in items:
-            summ = it.get("summary_3_sentences") or ["", "", ""]
-            while len(summ) < 3:
-                summ.append("")
+            summ = (it.get("summary_3_sentences") or [])[:3]
+            summ += [""] * (3 - len(summ))
             comps = it.get("companies") or []
             w.writerow({
                 "date": date_str,
@@ -1,25 +1,48 @@
 from __future__ import annotations
 
+import random
+import re
+import zlib
 from difflib import SequenceMatcher
 from typing import Any
 
 from .utils import normalize_url
 
 
+_PUNCT_RE = re.compile(r"[^0-9a-z가-힣\s]")
+_WS_RE = re.compile(r"\s+")
+
+# MinHash permutations: h(x) = (a * x + b) mod p, fixed seed so runs are reproducible
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_SEED = 1
+
+
 def title_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def dedupe_items(raw_items: list[dict[str, Any]], sim_threshold: float = 0.88) -> list[dict[str, Any]]:
-    """
-    Merge near-duplicate titles.
-    Keeps one representative item and stores up to 2 related links.
-    """
+def _prepare(raw_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     items = []
     for it in raw_items:
         it["link"] = normalize_url(it.get("link", ""))
         it["related_links"] = []
         items.append(it)
+    return items
+
+
+def _merge_into(k: dict[str, Any], it: dict[str, Any]) -> None:
+    # merge: keep representative (first) and add reference link if different
+    if it["link"] and it["link"] != k["link"]:
+        if len(k["related_links"]) < 2 and it["link"] not in k["related_links"]:
+            k["related_links"].append(it["link"])
+
+
+def dedupe_items(raw_items: list[dict[str, Any]], sim_threshold: float = 0.88) -> list[dict[str, Any]]:
+    """
+    Merge near-duplicate titles.
+    Keeps one representative item and stores up to 2 related links.
+    """
+    items = _prepare(raw_items)
 
     kept: list[dict[str, Any]] = []
 
@@ -27,13 +50,79 @@ def dedupe_items(raw_items: list[dict[str, Any]], sim_threshold: float = 0.88) -
         merged = False
         for k in kept:
             if title_similarity(it["title"], k["title"]) >= sim_threshold:
-                # merge: keep representative (first) and add reference link if different
-                if it["link"] and it["link"] != k["link"]:
-                    if len(k["related_links"]) < 2 and it["link"] not in k["related_links"]:
-                        k["related_links"].append(it["link"])
+                _merge_into(k, it)
+                merged = True
+                break
+        if not merged:
+            kept.append(it)
+
+    return kept
+
+
+def _title_shingles(title: str, n: int = 3) -> set[str]:
+    t = _PUNCT_RE.sub("", (title or "").lower())
+    t = _WS_RE.sub("", t)
+    if len(t) < n:
+        return {t}
+    return {t[i:i + n] for i in range(len(t) - n + 1)}
+
+
+def _minhash_perms(num_perm: int) -> list[tuple[int, int]]:
+    rnd = random.Random(_MINHASH_SEED)
+    return [(rnd.randrange(1, _MINHASH_PRIME), rnd.randrange(0, _MINHASH_PRIME)) for _ in range(num_perm)]
+
+
+def _minhash(shingles: set[str], perms: list[tuple[int, int]]) -> list[int]:
+    hs = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return [min((a * h + b) % _MINHASH_PRIME for h in hs) for a, b in perms]
+
+
+def dedupe_items_lsh(
+    raw_items: list[dict[str, Any]],
+    threshold: float = 0.88,
+    num_perm: int = 128,
+    rows: int = 4,
+) -> list[dict[str, Any]]:
+    """
+    Approximate dedupe_items: only titles that share an LSH band are compared.
+    MinHash over title 3-shingles (lowercased, punctuation stripped) is split into
+    num_perm // rows bands; items colliding in any band become candidates and are
+    checked with title_similarity(), so every merge is a real >= threshold match.
+
+    Candidate recall is probabilistic: a pair with shingle Jaccard J collides with
+    probability 1 - (1 - J**rows)**bands. title_similarity (SequenceMatcher) can be
+    >= threshold while J is low (e.g. a word scrambled in place), so such near
+    duplicates may be kept where dedupe_items would merge them. Smaller `rows` /
+    more bands raise recall at the cost of more candidate comparisons.
+    """
+    items = _prepare(raw_items)
+    perms = _minhash_perms(num_perm)
+    bands = max(1, num_perm // rows)
+
+    kept: list[dict[str, Any]] = []
+    buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(bands)]
+
+    for it in items:
+        sig = _minhash(_title_shingles(it["title"]), perms)
+        keys = [tuple(sig[b * rows:(b + 1) * rows]) for b in range(bands)]
+
+        cand: set[int] = set()
+        for b, key in enumerate(keys):
+            cand.update(buckets[b].get(key, ()))
+
+        merged = False
+        # kept order matters: merge into the earliest matching representative
+        for ki in sorted(cand):
+            k = kept[ki]
+            if title_similarity(it["title"], k["title"]) >= threshold:
+                _merge_into(k, it)
                 merged = True
                 break
+
         if not merged:
+            ki = len(kept)
             kept.append(it)
+            for b, key in enumerate(keys):
+                buckets[b].setdefault(key, []).append(ki)
 
     return kept
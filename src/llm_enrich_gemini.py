@@ -1,6 +1,7 @@
 # src/llm_enrich_gemini.py
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from typing import Any, Dict, List, Tuple, Optional
@@ -8,6 +9,8 @@ from typing import Any, Dict, List, Tuple, Optional
 from google import genai
 from pydantic import BaseModel, Field
 
+from .utils import split_sentences, squash_ws
+
 
 # -----------------------------
 # Model name normalization (single source of truth)
@@ -62,6 +65,10 @@ DESC_LIMIT = int(os.getenv("GEMINI_DESC_LIMIT", "1200"))
 TITLE_LIMIT = int(os.getenv("GEMINI_TITLE_LIMIT", "300"))
 MAX_COMPANIES = int(os.getenv("GEMINI_MAX_COMPANIES", "5"))  # LLM may output 1~5, we keep top 3 after merge
 
+# async split (aenrich_items): 0 = one batch with all items
+BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "0"))
+CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+
 
 # -----------------------------
 # Instruction: stronger for companies extraction
@@ -78,14 +85,6 @@ SYSTEM_INSTRUCTION = (
 # -----------------------------
 # Fallback summarization (content-based; no template)
 # -----------------------------
-def _split_sentences(text: str) -> List[str]:
-    text = re.sub(r"\s+", " ", (text or "")).strip()
-    if not text:
-        return []
-    parts = re.split(r"(?<=[\.\!\?])\s+|(?<=다\.)\s+|(?<=요\.)\s+", text)
-    return [p.strip() for p in parts if p and p.strip()]
-
-
 def _ensure_sentence_end(s: str) -> str:
     s = (s or "").strip()
     if not s:
@@ -97,9 +96,9 @@ def _ensure_sentence_end(s: str) -> str:
 
 def fallback_summary_3_sentences_from_description(title: str, description: str) -> List[str]:
     title = (title or "").strip()
-    desc = re.sub(r"\s+", " ", (description or "")).strip()
+    desc = squash_ws(description)
 
-    sents = _split_sentences(desc)
+    sents = split_sentences(desc)
     if len(sents) >= 3:
         return [_ensure_sentence_end(sents[0]), _ensure_sentence_end(sents[1]), _ensure_sentence_end(sents[2])]
 
@@ -112,14 +111,14 @@ def fallback_summary_3_sentences_from_description(title: str, description: str)
         leftover = base
         for s in sents[:2]:
             leftover = leftover.replace(s, " ")
-        leftover = re.sub(r"\s+", " ", leftover).strip() or base
+        leftover = squash_ws(leftover) or base
         n = len(leftover)
         cut = max(1, n // 2)
         s3 = leftover[cut:].strip() if len(leftover[cut:].strip()) > 10 else leftover[:cut].strip()
         return [_ensure_sentence_end(sents[0]), _ensure_sentence_end(sents[1]), _ensure_sentence_end(s3)]
 
     if len(sents) == 1:
-        leftover = re.sub(r"\s+", " ", base.replace(sents[0], " ")).strip() or base
+        leftover = squash_ws(base.replace(sents[0], " ")) or base
         n = len(leftover)
         cut1 = max(1, n // 2)
         s2 = leftover[:cut1].strip()
@@ -234,7 +233,7 @@ def _extract_json(text: str) -> str:
     return t
 
 
-def _call_batch_once(client: genai.Client, payload: List[Dict[str, Any]], model: str) -> BatchResp:
+def _batch_request(payload: List[Dict[str, Any]], model: str) -> Dict[str, Any]:
     prompt = f"""
 아래 기사 목록에 대해, 각 기사별로 3문장 요약과 관련 기업/기관명을 추출하세요.
 
@@ -254,23 +253,124 @@ def _call_batch_once(client: genai.Client, payload: List[Dict[str, Any]], model:
 {payload}
 """.strip()
 
-    resp = client.models.generate_content(
-        model=model,
-        contents=prompt,
-        config={
+    return {
+        "model": model,
+        "contents": prompt,
+        "config": {
             "system_instruction": SYSTEM_INSTRUCTION,
             "temperature": 0.2,
             "response_mime_type": "application/json",
             "response_schema": BatchResp,
         },
-    )
+    }
 
+
+def _parse_batch_resp(resp: Any) -> BatchResp:
     parsed = getattr(resp, "parsed", None)
     if parsed is None:
         parsed = BatchResp.model_validate_json(_extract_json(resp.text))
     return parsed
 
 
+def _call_batch_once(client: genai.Client, payload: List[Dict[str, Any]], model: str) -> BatchResp:
+    resp = client.models.generate_content(**_batch_request(payload, model))
+    return _parse_batch_resp(resp)
+
+
+async def _acall_batch_once(client: genai.Client, payload: List[Dict[str, Any]], model: str) -> BatchResp:
+    resp = await client.aio.models.generate_content(**_batch_request(payload, model))
+    return _parse_batch_resp(resp)
+
+
+def _merge_companies(*groups: List[str]) -> List[str]:
+    merged: List[str] = []
+    for c in [c for g in groups for c in g]:
+        if c and c not in merged:
+            merged.append(c)
+    return merged[:3]
+
+
+def _apply_fallback_only(out: List[Dict[str, Any]], n: int) -> None:
+    for i in range(n):
+        it = out[i]
+        it["summary_3_sentences"] = fallback_summary_3_sentences_from_description(
+            it.get("title", ""), it.get("description", "")
+        )
+        # rule-based companies
+        existing = _clean_company_list(it.get("companies") or [])
+        rules = _rule_extract_companies(it.get("title", ""), it.get("description", ""))
+        it["companies"] = _merge_companies(rules, existing)
+
+
+def _build_payload(out: List[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
+    # trim to control tokens
+    payload: List[Dict[str, Any]] = []
+    for i in range(n):
+        it = out[i]
+        payload.append(
+            {
+                "index": i,
+                "title": (it.get("title") or "")[:TITLE_LIMIT],
+                "description": (it.get("description") or "")[:DESC_LIMIT],
+                "source": (it.get("source") or "")[:120],
+                "link": (it.get("link") or "")[:300],
+            }
+        )
+    return payload
+
+
+def _add_to_mapping(
+    mapping: Dict[int, Tuple[List[str], List[str]]], parsed: BatchResp, size: int, offset: int = 0
+) -> None:
+    for x in parsed.items:
+        # index is relative to this batch; out-of-range answers must not land on a neighbouring batch
+        if not 0 <= int(x.index) < size:
+            continue
+        idx = int(x.index) + offset
+
+        s = [t.strip() for t in (x.summary_3_sentences or []) if isinstance(t, str)]
+        # normalize to exactly 3 strings
+        while len(s) < 3:
+            s.append("")
+        s = [_ensure_sentence_end(t) for t in s[:3]]
+
+        comps = _clean_company_list([c for c in (x.companies or []) if isinstance(c, str)])
+        mapping[idx] = (s, comps[:MAX_COMPANIES])
+
+
+def _apply_mapping(out: List[Dict[str, Any]], n: int, mapping: Dict[int, Tuple[List[str], List[str]]]) -> None:
+    # Apply results per item (no extra requests)
+    for i in range(n):
+        it = out[i]
+        title = it.get("title", "") or ""
+        desc = it.get("description", "") or ""
+
+        existing = _clean_company_list(it.get("companies") or [])
+        rules = _rule_extract_companies(title, desc)
+
+        if i in mapping:
+            sents, comps = mapping[i]
+            # if any sentence missing, fill with fallback (still no new request)
+            if sum(1 for t in sents if t.strip()) < 3:
+                sents = fallback_summary_3_sentences_from_description(title, desc)
+            it["summary_3_sentences"] = sents[:3]
+
+            # companies: LLM first, then rules, then existing
+            it["companies"] = _merge_companies(_clean_company_list(comps), rules, existing)
+        else:
+            it["summary_3_sentences"] = fallback_summary_3_sentences_from_description(title, desc)
+            it["companies"] = _merge_companies(rules, existing)
+
+    # For items beyond n, keep existing or ensure minimal structure
+    for j in range(n, len(out)):
+        it = out[j]
+        if not it.get("summary_3_sentences"):
+            it["summary_3_sentences"] = fallback_summary_3_sentences_from_description(
+                it.get("title", ""), it.get("description", "")
+            )
+        it["companies"] = _clean_company_list(it.get("companies") or [])[:3]
+
+
 def enrich_items(items: List[Dict[str, Any]], max_items: int, model: str | None = None) -> List[Dict[str, Any]]:
     """
     ✅ Gemini 요청 1회(기본)로 top-N 요약/기업 추출.
@@ -287,34 +387,10 @@ def enrich_items(items: List[Dict[str, Any]], max_items: int, model: str | None
     # No API key -> fallback only
     if not GEMINI_API_KEY:
         print("[WARN] GEMINI_API_KEY not set. Using content-based fallback summaries.", flush=True)
-        for i in range(n):
-            it = out[i]
-            it["summary_3_sentences"] = fallback_summary_3_sentences_from_description(
-                it.get("title", ""), it.get("description", "")
-            )
-            # rule-based companies
-            existing = _clean_company_list(it.get("companies") or [])
-            rules = _rule_extract_companies(it.get("title", ""), it.get("description", ""))
-            merged = []
-            for c in rules + existing:
-                if c and c not in merged:
-                    merged.append(c)
-            it["companies"] = merged[:3]
+        _apply_fallback_only(out, n)
         return out
 
-    # Prepare payload (trim to control tokens)
-    payload: List[Dict[str, Any]] = []
-    for i in range(n):
-        it = out[i]
-        payload.append(
-            {
-                "index": i,
-                "title": (it.get("title") or "")[:TITLE_LIMIT],
-                "description": (it.get("description") or "")[:DESC_LIMIT],
-                "source": (it.get("source") or "")[:120],
-                "link": (it.get("link") or "")[:300],
-            }
-        )
+    payload = _build_payload(out, n)
 
     client = genai.Client(api_key=GEMINI_API_KEY)
 
@@ -338,63 +414,62 @@ def enrich_items(items: List[Dict[str, Any]], max_items: int, model: str | None
     # Build mapping index -> (sents, comps)
     mapping: Dict[int, Tuple[List[str], List[str]]] = {}
     if parsed is not None:
-        for x in parsed.items:
-            idx = int(x.index)
-
-            s = [t.strip() for t in (x.summary_3_sentences or []) if isinstance(t, str)]
-            # normalize to exactly 3 strings
-            while len(s) < 3:
-                s.append("")
-            s = [_ensure_sentence_end(t) for t in s[:3]]
-
-            comps = _clean_company_list([c for c in (x.companies or []) if isinstance(c, str)])
-            mapping[idx] = (s, comps[:MAX_COMPANIES])
+        _add_to_mapping(mapping, parsed, size=n)
     else:
         print(f"[WARN] Gemini batch enrichment failed (no retry beyond {BATCH_RETRIES}): {last_err}", flush=True)
 
-    # Apply results per item (no extra requests)
-    for i in range(n):
-        it = out[i]
-        title = it.get("title", "") or ""
-        desc = it.get("description", "") or ""
+    _apply_mapping(out, n, mapping)
+    return out
 
-        # summaries
-        if i in mapping:
-            sents, comps = mapping[i]
-            # if any sentence missing, fill with fallback (still no new request)
-            if sum(1 for t in sents if t.strip()) < 3:
-                sents = fallback_summary_3_sentences_from_description(title, desc)
-            it["summary_3_sentences"] = sents[:3]
 
-            # companies: LLM + existing + rule booster
-            existing = _clean_company_list(it.get("companies") or [])
-            rules = _rule_extract_companies(title, desc)
+async def aenrich_items(
+    items: List[Dict[str, Any]],
+    max_items: int,
+    model: str | None = None,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    enrich_items와 동일한 결과를 만들되, top-N을 batch_size개씩 나눠 동시에 요청.
+    - GEMINI_BATCH_SIZE 미설정(기본): 전체 1배치 = 요청 1회 (enrich_items와 동일)
+    - GEMINI_CONCURRENCY(기본 8): 동시에 진행할 배치 수 상한
+    - 실패한 배치만 fallback/룰로 보강
+    """
+    out = items[:]
+    n = min(len(out), max_items)
+    use_model = _normalize_model_name(model) if model else SUMMARY_MODEL
+
+    if not GEMINI_API_KEY or n == 0:
+        return enrich_items(out, max_items=max_items, model=model)
 
-            merged: List[str] = []
-            # LLM first, then rules, then existing
-            for c in _clean_company_list(comps) + rules + existing:
-                if c and c not in merged:
-                    merged.append(c)
+    bs = batch_size or BATCH_SIZE or n
+    sem = asyncio.Semaphore(max(1, concurrency or CONCURRENCY))
+    payload = _build_payload(out, n)
+    client = genai.Client(api_key=GEMINI_API_KEY)
 
-            it["companies"] = merged[:3]
+    async def _run(st: int) -> Optional[BatchResp]:
+        # each batch is re-indexed from 0 so the prompt's "0..N-1" holds
+        batch = [dict(p, index=p["index"] - st) for p in payload[st : st + bs]]
+        last_err: Optional[Exception] = None
+        async with sem:
+            for attempt in range(BATCH_RETRIES + 1):
+                try:
+                    return await _acall_batch_once(client, batch, model=use_model)
+                except Exception as e:
+                    last_err = e
+        print(f"[WARN] Gemini batch {st}..{st + len(batch) - 1} failed: {last_err}", flush=True)
+        return None
+
+    starts = list(range(0, n, bs))
+    results = await asyncio.gather(*(_run(st) for st in starts))
 
-        else:
-            it["summary_3_sentences"] = fallback_summary_3_sentences_from_description(title, desc)
-            existing = _clean_company_list(it.get("companies") or [])
-            rules = _rule_extract_companies(title, desc)
-            merged: List[str] = []
-            for c in rules + existing:
-                if c and c not in merged:
-                    merged.append(c)
-            it["companies"] = merged[:3]
+    if DEBUG_LOG:
+        print(f"[INFO] Gemini async batches={len(starts)} size={bs} model={use_model}", flush=True)
 
-    # For items beyond n, keep existing or ensure minimal structure
-    for j in range(n, len(out)):
-        it = out[j]
-        if not it.get("summary_3_sentences"):
-            it["summary_3_sentences"] = fallback_summary_3_sentences_from_description(
-                it.get("title", ""), it.get("description", "")
-            )
-        it["companies"] = _clean_company_list(it.get("companies") or [])[:3]
+    mapping: Dict[int, Tuple[List[str], List[str]]] = {}
+    for st, parsed in zip(starts, results):
+        if parsed is not None:
+            _add_to_mapping(mapping, parsed, size=min(bs, n - st), offset=st)
 
+    _apply_mapping(out, n, mapping)
     return out
@@ -7,7 +7,7 @@ import time
 import random
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Sequence, Tuple, Optional
 from zoneinfo import ZoneInfo
 from urllib.parse import urlparse
 
@@ -113,7 +113,7 @@ def collect_naver_last24h_multiquery(
     *,
     client_id: str,
     client_secret: str,
-    queries: List[str],
+    queries: Sequence[str],
     max_fetch: int = 150,
     sort: str = "date",
     timeout_sec: int = 20,
@@ -442,7 +442,7 @@ def collect_naver_top_last24h_deduped_and_ranked(
     *,
     client_id: str,
     client_secret: str,
-    queries: List[str],
+    queries: Sequence[str],
     fetch_n: int = 150,
     top_k: int = 15,
 ) -> Tuple[List[NaverNewsItem], List[int], Dict[str, Any]]:
@@ -5,7 +5,7 @@ import os
 from typing import Any, Dict, List, Tuple
 
 import src.naver_collector as nc
-from src.tagger import classify_category, extract_companies
+from src.tagger import extract_companies, tag_article
 from src.llm_enrich_gemini import enrich_items
 
 
@@ -124,8 +124,7 @@ def main():
         }
 
         # 분야/기업(사전) 먼저 채움
-        item["category"] = classify_category(title, desc)
-        item["companies"] = extract_companies(title, desc, max_n=3)
+        item["category"], item["companies"] = tag_article(title, desc, max_companies=3)
 
         items.append(item)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from .utils import domain_of
@@ -33,6 +34,7 @@ def infer_tier(link: str, sources_config: dict) -> int:
     return 3
 
 
+@lru_cache(maxsize=256)
 def popularity_signal_from_source(source_name: str) -> str:
     # MVP: if the feed itself is a "Most read/Trending" feed, label it.
     s = source_name.lower()
@@ -1,24 +1,58 @@
 # src/run.py
 from __future__ import annotations
 
+import asyncio
+import heapq
+import json
 import os
 import time
+import uuid
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple, Optional
 
 import yaml
 
+from google import genai
+from pydantic import BaseModel, Field
+
 from .utils import getenv_int, kst_yesterday_date_str
 from .collector import collect_from_rss, google_news_rss_url
-from .dedupe import dedupe_items
-from .ranker import infer_tier, popularity_signal_from_source
-from .tagger import classify_category, extract_companies
-from .llm_enrich_gemini import enrich_items
+from . import score_cache
+from .dedupe import dedupe_items_lsh
+from .ranker import popularity_signal_from_source
+from .tagger import tag_item
+from .llm_enrich_gemini import aenrich_items
 from .renderer import write_outputs
 from .datastore import write_daily_csv, upsert_master_csv, upsert_master_json
 from .sitegen import build_daily_page, build_root_index
 
 
+# -----------------------------
+# LLM response schemas
+# -----------------------------
+class _TitleScore(BaseModel):
+    index: int
+    event_key: str
+    battery_relevance: int = Field(..., ge=0, le=100)
+    monitoring_importance: int = Field(..., ge=0, le=100)
+
+
+class _Resp(BaseModel):
+    items: List[_TitleScore]
+
+
+class _EventKey(BaseModel):
+    index: int
+    event_key: str = Field(..., description="same event => same key, ASCII letters/digits/_")
+
+
+class _EventKeyResp(BaseModel):
+    items: List[_EventKey]
+
+
 # -----------------------------
 # Logging helpers
 # -----------------------------
@@ -33,11 +67,24 @@ def _t() -> float:
 # -----------------------------
 # Config
 # -----------------------------
-def load_config() -> dict:
+def _freeze(x: Any) -> Any:
+    # read-only view so the cached config can be shared safely across call sites
+    if isinstance(x, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in x.items()})
+    if isinstance(x, list):
+        return tuple(_freeze(v) for v in x)
+    return x
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Mapping[str, Any]:
     p = Path("config/sources.yaml")
+    pj = Path("config/sources.json")  # built by scripts/yaml_to_json.py
+    if pj.exists() and (not p.exists() or pj.stat().st_mtime >= p.stat().st_mtime):
+        return _freeze(json.loads(pj.read_bytes()) or {})
     if not p.exists():
-        return {}
-    return yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        return MappingProxyType({})
+    return _freeze(yaml.safe_load(p.read_text(encoding="utf-8")) or {})
 
 
 def _normalize_model_name(name: str) -> str:
@@ -49,7 +96,8 @@ def _normalize_model_name(name: str) -> str:
     return low
 
 
-def get_models() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def get_models() -> Mapping[str, str]:
     """
     Single place to manage models across modules.
     Env priority:
@@ -62,19 +110,21 @@ def get_models() -> Dict[str, str]:
     dedupe = _normalize_model_name(os.getenv("GEMINI_MODEL_DEDUPE", base))
     rank = _normalize_model_name(os.getenv("GEMINI_MODEL_RANK", base))
     summary = _normalize_model_name(os.getenv("GEMINI_MODEL_SUMMARY", base))
-    return {"base": base, "dedupe": dedupe, "rank": rank, "summary": summary}
+    return MappingProxyType({"base": base, "dedupe": dedupe, "rank": rank, "summary": summary})
 
 
-def build_google_news_queries() -> list[tuple[str, str]]:
+@lru_cache(maxsize=1)
+def build_google_news_queries() -> tuple[tuple[str, str], ...]:
     core = "battery (cathode OR anode OR electrolyte OR separator OR solid-state OR sodium-ion OR recycling OR LFP OR NCM OR precursor OR lithium)"
     scale = "battery (gigafactory OR plant OR production OR capacity OR investment OR supply agreement OR off-take OR MOU OR JV OR merger OR acquisition)"
     policy = "battery (policy OR regulation OR subsidy OR tariff OR IRA OR CBAM OR export control OR sanctions)"
     queries = [("Google News - Core", core), ("Google News - Scale", scale), ("Google News - Policy", policy)]
-    return [(name, google_news_rss_url(q, hl="en", gl="US", ceid="US:en")) for name, q in queries]
+    return tuple((name, google_news_rss_url(q, hl="en", gl="US", ceid="US:en")) for name, q in queries)
 
 
-def _default_naver_queries() -> list[str]:
-    return [
+@lru_cache(maxsize=1)
+def _default_naver_queries() -> tuple[str, ...]:
+    return (
         "배터리 2차전지",
         "전고체 배터리",
         "나트륨이온 배터리",
@@ -85,14 +135,15 @@ def _default_naver_queries() -> list[str]:
         "분리막",
         "ESS 배터리",
         "배터리 관세 IRA",
-    ]
+    )
 
 
-def _get_naver_queries() -> list[str]:
+@lru_cache(maxsize=1)
+def _get_naver_queries() -> tuple[str, ...]:
     s = (os.getenv("NAVER_QUERIES") or "").strip()
     if not s:
         return _default_naver_queries()
-    return [x.strip() for x in s.split(",") if x.strip()]
+    return tuple(x.strip() for x in s.split(",") if x.strip())
 
 
 # -----------------------------
@@ -102,6 +153,13 @@ def _monitor_score(rel: int, imp: int) -> float:
     return 0.7 * float(rel) + 0.3 * float(imp)
 
 
+def _clamp_score(v: Any) -> int:
+    try:
+        return max(0, min(100, int(v)))
+    except (TypeError, ValueError):
+        return 0
+
+
 def _pop_strength(sig: str) -> int:
     # sort helper: stronger popularity first
     s = (sig or "").lower()
@@ -117,77 +175,95 @@ def _pop_strength(sig: str) -> int:
 # -----------------------------
 # GOOGLE/RSS: collect candidates, then LLM select by battery relevance + monitoring importance
 # -----------------------------
+SYSTEM_GOOGLE_SCORE = (
+    "당신은 배터리 산업 뉴스 편집자입니다. 입력은 한 줄에 하나씩 'index<TAB>제목' 형식입니다.\n"
+    "각 제목에 대해 index, event_key, battery_relevance, monitoring_importance를 산출하세요.\n"
+    "규칙:\n"
+    "- event_key: 같은 사건/이슈면 같은 키(ASCII letters/digits/_). 표현이 달라도 동일 사건이면 동일 키.\n"
+    "- battery_relevance(0~100): 배터리 산업과의 직접 연관성.\n"
+    "- monitoring_importance(0~100): 산업 모니터링 관점 파급력.\n"
+    "- 모든 index(0..N-1)에 대해 1개씩 출력.\n"
+    "- 제목만 보고 판단."
+)
+
+
+def _score_titles_by_llm(titles: List[str], api_key: str, model: str) -> List[Dict[str, Any]]:
+    """Returns raw score dicts: [{"index", "event_key", "battery_relevance", "monitoring_importance"}, ...]"""
+    client = genai.Client(api_key=api_key)
+
+    # rules live in the system instruction; the per-call content is just the title list
+    prompt = "\n".join(f"{i}\t{' '.join(t.split())}" for i, t in enumerate(titles))
+
+    resp = client.models.generate_content(
+        model=model,
+        contents=prompt,
+        config={
+            "system_instruction": SYSTEM_GOOGLE_SCORE,
+            "temperature": 0.2,
+            "response_mime_type": "application/json",
+            "response_schema": _Resp,
+        },
+    )
+
+    # structured output: the SDK guarantees schema-shaped JSON, so parse it as-is
+    return json.loads(resp.text or "{}").get("items", [])
+
+
+def _fallback_pick(candidates: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    # no LLM scores: candidates are already LSH-deduped by collect_google_candidates
+    picked = candidates[:top_k]
+    for it in picked:
+        it["battery_relevance"] = 60
+        it["monitoring_importance"] = 10
+        it["monitor_score"] = int(round(_monitor_score(60, 10)))
+    return picked
+
+
 def _select_google_by_llm_battery_relevance(
     candidates: List[Dict[str, Any]],
     top_k: int,
-    models: Dict[str, str],
+    models: Mapping[str, str],
 ) -> List[Dict[str, Any]]:
     api_key = (os.getenv("GEMINI_API_KEY") or "").strip()
     if not api_key or not candidates:
-        picked = candidates[:top_k]
-        for it in picked:
-            it["battery_relevance"] = 60
-            it["monitoring_importance"] = 10
-            it["monitor_score"] = int(round(_monitor_score(60, 10)))
-        return picked
+        return _fallback_pick(candidates, top_k)
 
     try:
-        from google import genai
-        from pydantic import BaseModel, Field
-        from typing import List as _List
-
-        class _TitleScore(BaseModel):
-            index: int
-            event_key: str
-            battery_relevance: int = Field(..., ge=0, le=100)
-            monitoring_importance: int = Field(..., ge=0, le=100)
-
-        class _Resp(BaseModel):
-            items: _List[_TitleScore]
-
-        client = genai.Client(api_key=api_key)
-        titles = [(i, (candidates[i].get("title") or "").strip()) for i in range(len(candidates))]
-
-        prompt = (
-            "다음은 뉴스 제목 목록입니다. 각 제목에 대해 배터리 산업 연관성과 모니터링 중요도를 JSON으로만 출력하세요.\n\n"
-            "출력 스키마:\n"
-            "{\n"
-            "  \"items\": [\n"
-            "    {\"index\": 0, \"event_key\": \"...\", \"battery_relevance\": 0-100, \"monitoring_importance\": 0-100}\n"
-            "  ]\n"
-            "}\n\n"
-            "규칙:\n"
-            "- event_key: 같은 사건/이슈면 같은 키(ASCII letters/digits/_). 표현이 달라도 동일 사건이면 동일 키.\n"
-            "- battery_relevance(0~100): 배터리 산업과의 직접 연관성.\n"
-            "- monitoring_importance(0~100): 산업 모니터링 관점 파급력.\n"
-            "- 모든 index(0..N-1)에 대해 1개씩 출력.\n"
-            "- 제목만 보고 판단.\n\n"
-            "[제목 목록]\n"
-            + "\n".join([f"{i}: {t}" for i, t in titles])
-        )
-
-        resp = client.models.generate_content(
-            model=models["rank"],
-            contents=prompt,
-            config={"temperature": 0.2},
-        )
-
-        text = (resp.text or "").strip()
-        s = text.find("{")
-        e = text.rfind("}")
-        if s != -1 and e != -1 and e > s:
-            text = text[s : e + 1]
-
-        parsed = _Resp.model_validate_json(text)
+        titles = [(candidates[i].get("title") or "").strip() for i in range(len(candidates))]
 
         rel_by_i: Dict[int, int] = {}
         imp_by_i: Dict[int, int] = {}
         ek_by_i: Dict[int, str] = {}
-        for x in parsed.items:
-            rel_by_i[int(x.index)] = int(x.battery_relevance)
-            imp_by_i[int(x.index)] = int(x.monitoring_importance)
-            ek = (x.event_key or f"item_{x.index}").strip()[:80] or f"item_{x.index}"
-            ek_by_i[int(x.index)] = ek
+
+        # exact-title cache hits skip the LLM; only misses are scored.
+        # scope: a different rank model or prompt must not reuse old scores
+        scope = f"{models['rank']}\0{SYSTEM_GOOGLE_SCORE}"
+        run_id = uuid.uuid4().hex[:12]
+        cached = score_cache.get_many(titles, scope=scope)
+        for i, (hit_run, ek, rel, imp) in cached.items():
+            # event_key only means something inside the prompt that produced it: hits from
+            # different past runs never share a group (cross-run duplicates -> global_dedupe_items)
+            ek_by_i[i], rel_by_i[i], imp_by_i[i] = f"{hit_run}:{ek}", rel, imp
+
+        miss = [i for i in range(len(titles)) if i not in cached]
+        _log(f"[INFO] GOOGLE score cache: hit={len(cached)} miss={len(miss)}")
+
+        if miss:
+            parsed = _score_titles_by_llm([titles[i] for i in miss], api_key=api_key, model=models["rank"])
+            fresh: List[Tuple[str, str, int, int]] = []
+            for x in parsed:
+                j = int(x["index"])
+                if not 0 <= j < len(miss):
+                    continue
+                i = miss[j]
+                rel_by_i[i] = _clamp_score(x.get("battery_relevance"))
+                imp_by_i[i] = _clamp_score(x.get("monitoring_importance"))
+                ek = str(x.get("event_key") or f"item_{i}").strip()[:80] or f"item_{i}"
+                ek_by_i[i] = f"{run_id}:{ek}"
+                if x.get("event_key"):
+                    fresh.append((titles[i], ek, rel_by_i[i], imp_by_i[i]))
+
+            score_cache.put_many(fresh, run_id=run_id, scope=scope)
 
         # one representative per event_key
         by_event: Dict[str, List[int]] = {}
@@ -230,16 +306,11 @@ def _select_google_by_llm_battery_relevance(
 
     except Exception as e:
         _log(f"[WARN] GOOGLE LLM select failed -> fallback. err={e}")
-        picked = candidates[:top_k]
-        for it in picked:
-            it["battery_relevance"] = 60
-            it["monitoring_importance"] = 10
-            it["monitor_score"] = int(round(_monitor_score(60, 10)))
-        return picked
+        return _fallback_pick(candidates, top_k)
 
 
-def collect_google_candidates(target_date: str, cfg: dict) -> List[Dict[str, Any]]:
-    raw: List[Dict[str, Any]] = []
+def collect_google_candidates(target_date: str, cfg: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    chunks: List[List[Dict[str, Any]]] = []
 
     for source_name, url in build_google_news_queries():
         got = collect_from_rss(url, source_name, target_date)
@@ -247,7 +318,7 @@ def collect_google_candidates(target_date: str, cfg: dict) -> List[Dict[str, Any
             it["provider"] = "google"
             it.setdefault("related_links", [])
             it["popularity_signal"] = popularity_signal_from_source(it.get("source", ""))
-        raw.extend(got)
+        chunks.append(got)
 
     for src in cfg.get("rss_sources", {}).get("fixed", []):
         name = src.get("name", "RSS")
@@ -259,15 +330,19 @@ def collect_google_candidates(target_date: str, cfg: dict) -> List[Dict[str, Any
             it["provider"] = "rss"
             it.setdefault("related_links", [])
             it["popularity_signal"] = popularity_signal_from_source(it.get("source", ""))
-        raw.extend(got)
+        chunks.append(got)
 
+    raw = list(chain.from_iterable(chunks))
     if not raw:
         return []
 
-    return dedupe_items(raw, sim_threshold=float(os.getenv("GOOGLE_DEDUPE_THRESHOLD", "0.88")))
+    return dedupe_items_lsh(raw, threshold=float(os.getenv("GOOGLE_DEDUPE_THRESHOLD", "0.88")))
 
 
-def collect_google_items(target_date: str, need: int, cfg: dict, models: Dict[str, str]) -> List[Dict[str, Any]]:
+def collect_google_items(target_date: str, need: int, cfg: Mapping[str, Any], models: Mapping[str, str]) -> List[Dict[str, Any]]:
+    # the LSH pass in collect_google_candidates stays: without it near-identical titles (and exact
+    # repeats, which are separate cache hits) use up the `need` slots before global_dedupe_items()
+    # drops them, and the no-LLM fallback has no other dedupe. The global pass catches rewordings.
     cand = collect_google_candidates(target_date, cfg)
     _log(f"[INFO] GOOGLE candidates: {len(cand)}")
     if not cand:
@@ -284,7 +359,7 @@ def collect_google_items(target_date: str, need: int, cfg: dict, models: Dict[st
 # -----------------------------
 # NAVER
 # -----------------------------
-def collect_naver_items(target_date: str, need: int, models: Dict[str, str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+def collect_naver_items(target_date: str, need: int, models: Mapping[str, str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     naver_id = (os.getenv("NAVER_CLIENT_ID") or "").strip()
     naver_secret = (os.getenv("NAVER_CLIENT_SECRET") or "").strip()
     if not naver_id or not naver_secret:
@@ -340,36 +415,25 @@ def collect_naver_items(target_date: str, need: int, models: Dict[str, str]) ->
 # -----------------------------
 # GLOBAL: Strong dedupe by LLM event_key (1 call) -> fallback to sim dedupe
 # -----------------------------
-def global_dedupe_items(items: List[Dict[str, Any]], models: Dict[str, str]) -> List[Dict[str, Any]]:
+def global_dedupe_items(items: List[Dict[str, Any]], models: Mapping[str, str]) -> List[Dict[str, Any]]:
     """
     Stronger dedupe than pure string similarity:
       - If GEMINI_API_KEY present: 1 request -> assign event_key to each title and keep 1 representative per event.
       - Representative preference: lower tier (1 better), higher popularity, higher monitor_score, then 최신.
-      - On any failure/quota: fallback to dedupe_items(sim_threshold=GLOBAL_DEDUPE_THRESHOLD)
+      - On any failure/quota: fallback to dedupe_items_lsh(threshold=GLOBAL_DEDUPE_THRESHOLD)
     """
     if not items:
         return items
 
     api_key = (os.getenv("GEMINI_API_KEY") or "").strip()
     if not api_key:
-        return dedupe_items(items, sim_threshold=float(os.getenv("GLOBAL_DEDUPE_THRESHOLD", "0.88")))
+        return dedupe_items_lsh(items, threshold=float(os.getenv("GLOBAL_DEDUPE_THRESHOLD", "0.88")))
 
     # allow disable
     if (os.getenv("GLOBAL_LLM_DEDUPE", "1").strip() != "1"):
-        return dedupe_items(items, sim_threshold=float(os.getenv("GLOBAL_DEDUPE_THRESHOLD", "0.88")))
+        return dedupe_items_lsh(items, threshold=float(os.getenv("GLOBAL_DEDUPE_THRESHOLD", "0.88")))
 
     try:
-        from google import genai
-        from pydantic import BaseModel, Field
-        from typing import List as _List
-
-        class _EK(BaseModel):
-            index: int
-            event_key: str = Field(..., description="same event => same key, ASCII letters/digits/_")
-
-        class _Resp(BaseModel):
-            items: _List[_EK]
-
         client = genai.Client(api_key=api_key)
         titles = [(i, (items[i].get("title") or "").strip()[:200]) for i in range(len(items))]
 
@@ -398,7 +462,7 @@ def global_dedupe_items(items: List[Dict[str, Any]], models: Dict[str, str]) ->
         if s != -1 and e != -1 and e > s:
             text = text[s : e + 1]
 
-        parsed = _Resp.model_validate_json(text)
+        parsed = _EventKeyResp.model_validate_json(text)
 
         ek_by_i: Dict[int, str] = {}
         for x in parsed.items:
@@ -451,7 +515,7 @@ def global_dedupe_items(items: List[Dict[str, Any]], models: Dict[str, str]) ->
 
     except Exception as e:
         _log(f"[WARN] GLOBAL LLM dedupe failed -> fallback sim dedupe. err={e}")
-        return dedupe_items(items, sim_threshold=float(os.getenv("GLOBAL_DEDUPE_THRESHOLD", "0.88")))
+        return dedupe_items_lsh(items, threshold=float(os.getenv("GLOBAL_DEDUPE_THRESHOLD", "0.88")))
 
 
 # -----------------------------
@@ -496,10 +560,9 @@ def main() -> None:
     # 4) Add tier/category/companies early (helps dedupe representative selection)
     _log("[STEP] Add tier/category/companies ...")
     for it in raw:
-        it["tier"] = infer_tier(it.get("link", ""), cfg)
-        it["category"] = classify_category(it.get("title", ""), it.get("description", ""))
-        it["companies"] = extract_companies(it.get("title", ""), it.get("description", ""), max_n=3)
-        it.setdefault("popularity_signal", popularity_signal_from_source(it.get("source", "")))
+        it.update(tag_item(it, cfg, max_companies=3))
+        if "popularity_signal" not in it:
+            it["popularity_signal"] = popularity_signal_from_source(it.get("source", ""))
         it.setdefault("monitor_score", int(it.get("monitor_score", 0)))
 
     # 5) Strong global dedupe (LLM event_key if possible)
@@ -517,8 +580,8 @@ def main() -> None:
         # tier asc, pop desc, mscore desc, pub desc
         return (tier, -pop, -mscore, pub)
 
-    raw.sort(key=_sort_key)
-    items = raw[:max_items]
+    # only the top max_items are needed: partial heap select, same order as sorted()[:max_items]
+    items = heapq.nsmallest(max_items, raw, key=_sort_key)
 
     _log(
         f"[STATS] items_final={len(items)} "
@@ -533,7 +596,7 @@ def main() -> None:
     # 7) Gemini batch enrichment for summaries + companies
     _log("[STEP] Gemini enrich (summary_3_sentences + companies) ...")
     t3 = _t()
-    items = enrich_items(items, max_items=len(items), model=models["summary"])
+    items = asyncio.run(aenrich_items(items, max_items=len(items), model=models["summary"]))
     _log(f"[DONE] Gemini enrich finished in {(_t()-t3):.1f}s")
 
     summaries_present = sum(1 for x in items if x.get("summary_3_sentences"))
@@ -0,0 +1,100 @@
+# src/score_cache.py
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+
+# 제목 정확 일치 캐시: Google News가 며칠씩 같은 제목을 다시 내보내므로 재채점 생략
+# event_key는 그 키를 만든 프롬프트(채점 1회) 안에서만 의미가 있으므로 run_id를 함께 저장한다
+DEFAULT_PATH = Path(os.getenv("SCORE_CACHE_PATH", "data/score_cache.sqlite"))
+TTL_DAYS = int(os.getenv("SCORE_CACHE_TTL_DAYS", "14"))
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize(title: str) -> str:
+    return _WS_RE.sub(" ", (title or "").lower()).strip()
+
+
+def title_hash(title: str, scope: str = "") -> str:
+    # scope(모델명·프롬프트 등)가 바뀌면 다른 키가 되어 예전 점수를 쓰지 않는다
+    return hashlib.blake2b(f"{scope}\0{_normalize(title)}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("DROP TABLE IF EXISTS title_scores")  # v1: run_id 없음, scope 없는 키
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS title_scores_v2 ("
+        " title_hash TEXT PRIMARY KEY, run_id TEXT, event_key TEXT, rel INT, imp INT, ts INT)"
+    )
+    return conn
+
+
+def get_many(
+    titles: list[str], scope: str = "", db_path: Path = DEFAULT_PATH, ttl_days: int = TTL_DAYS
+) -> dict[int, tuple[str, str, int, int]]:
+    """
+    Returns {position in titles: (run_id, event_key, rel, imp)} for fresh cache hits.
+    event_keys are only comparable between hits with the same run_id.
+    Cache errors are treated as misses.
+    """
+    if not titles:
+        return {}
+    hashes = [title_hash(t, scope) for t in titles]
+    min_ts = int(time.time()) - ttl_days * 86400
+    try:
+        conn = _connect(db_path)
+        try:
+            rows: dict[str, tuple[str, str, int, int]] = {}
+            uniq = list(set(hashes))
+            for st in range(0, len(uniq), 500):
+                chunk = uniq[st : st + 500]
+                q = (
+                    "SELECT title_hash, run_id, event_key, rel, imp FROM title_scores_v2"
+                    f" WHERE ts >= ? AND title_hash IN ({','.join('?' * len(chunk))})"
+                )
+                for h, run_id, ek, rel, imp in conn.execute(q, [min_ts, *chunk]):
+                    rows[h] = (run_id, ek, int(rel), int(imp))
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"[WARN] score cache read failed: {e}", flush=True)
+        return {}
+    return {i: rows[h] for i, h in enumerate(hashes) if h in rows}
+
+
+def put_many(
+    entries: list[tuple[str, str, int, int]],
+    run_id: str,
+    scope: str = "",
+    db_path: Path = DEFAULT_PATH,
+    ttl_days: int = TTL_DAYS,
+) -> None:
+    """
+    entries: [(title, event_key, rel, imp), ...] scored together in one prompt (run_id)
+    Also drops rows older than ttl_days so the file stays small.
+    """
+    if not entries:
+        return
+    now = int(time.time())
+    try:
+        conn = _connect(db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO title_scores_v2 (title_hash, run_id, event_key, rel, imp, ts)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(title_hash(t, scope), run_id, ek, int(rel), int(imp), now) for t, ek, rel, imp in entries],
+                )
+                conn.execute("DELETE FROM title_scores_v2 WHERE ts < ?", (now - ttl_days * 86400,))
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"[WARN] score cache write failed: {e}", flush=True)
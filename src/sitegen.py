@@ -1,96 +1,58 @@
 from __future__ import annotations
 
-import html
+import hashlib
+import io
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from string import Template
+from typing import Any, Final
 
 
-def _e(s: str) -> str:
-    return html.escape(s or "", quote=True)
-
-
-def _cat_slug(cat: str) -> str:
-    m = {
-        "cathode": "cathode",
-        "anode": "anode",
-        "electrolyte": "electrolyte",
-        "separator": "separator",
-        "전고체": "solid_state",
-        "나트륨": "sodium",
-        "재활용": "recycling",
-        "장비": "equipment",
-        "정책": "policy",
-        "기타": "etc",
-    }
-    return m.get(cat, "etc")
-
-
-def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path) -> Path:
-    day_dir = docs_dir / date_str
-    day_dir.mkdir(parents=True, exist_ok=True)
-
-    cards_html = []
-    for i, it in enumerate(items, 1):
-        title = _e(it.get("title", ""))
-        link = _e(it.get("link", ""))
-        source = _e(it.get("source", ""))
-        category_raw = it.get("category", "기타")
-        category = _e(category_raw)
-        tier = _e(str(it.get("tier", 3)))
-        pub = _e(it.get("published_at", date_str))
-
-        companies = it.get("companies", []) or []
-        comp_html = "".join(f'<span class="chip">{_e(c)}</span>' for c in companies) if companies else '<span class="chip muted">-</span>'
-
-        summ = it.get("summary_3_sentences") or ["", "", ""]
-        while len(summ) < 3:
-            summ.append("")
-        summ_html = "".join(f"<li>{_e(s)}</li>" for s in summ[:3] if s)
-
-        cat_class = f"cat-{_cat_slug(category_raw)}"
-
-        cards_html.append(f"""
-        <a class="card {cat_class}" href="{link}" target="_blank" rel="noopener noreferrer">
+# Templates are compiled once at import; string.Template uses $name, so the CSS
+# below is plain text (no {{ }} escaping). It is written once to docs/assets/.
+# Pages are split around the card/list slot and streamed into one StringIO.
+_CARD_TMPL = Template("""
+        <a class="card $cat_class" href="$link" target="_blank" rel="noopener noreferrer">
           <div class="cardTop">
-            <div class="num">{i:02d}</div>
+            <div class="num">$num</div>
             <div class="badgeRow">
-              <span class="badge">{category}</span>
-              <span class="meta">Tier {tier}</span>
+              <span class="badge">$category</span>
+              <span class="meta">Tier $tier</span>
             </div>
           </div>
 
-          <div class="title">{title}</div>
+          <div class="title">$title</div>
 
           <div class="rows">
             <div class="row">
               <div class="k">언론사</div>
-              <div class="v">{source}</div>
+              <div class="v">$source</div>
             </div>
             <div class="row">
               <div class="k">관련기업</div>
-              <div class="v chips">{comp_html}</div>
+              <div class="v chips">$comp_html</div>
             </div>
           </div>
 
           <div class="summaryBox">
             <div class="summaryTitle">3문장 요약</div>
-            <ul class="summary">{summ_html}</ul>
+            <ul class="summary">$summ_html</ul>
           </div>
 
           <div class="footer">
-            <div>{pub}</div>
+            <div>$pub</div>
           </div>
         </a>
         """)
 
-    html_text = f"""<!doctype html>
-<html lang="ko">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>배터리 카드뉴스 - {date_str}</title>
-  <style>
-    :root {{
+# 일자 페이지 공통 CSS: docs/assets/cards.css 한 파일로 쓰고 각 페이지는 <link>로 참조
+_CSS_PATH = "assets/cards.css"
+_CSS: Final[str] = """    :root {
       --blue:#0B4EDB;
       --blue2:#0A43C2;
       --yellow:#FFD24A;
@@ -111,31 +73,31 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       --equipment:#6B7280;
       --policy:#EF4444;
       --etc:#64748B;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{
+    }
+    * { box-sizing: border-box; }
+    body {
       margin:0;
       font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, sans-serif;
       background: linear-gradient(180deg,var(--blue),var(--blue2));
       color: var(--ink);
-    }}
-    .wrap {{
+    }
+    .wrap {
       max-width: 1100px;
       margin: 0 auto;
       padding: 28px 16px 60px;
-    }}
-    .frame {{
+    }
+    .frame {
       background: var(--card);
       border-radius: 22px;
       border: 6px solid rgba(255,255,255,.25);
       box-shadow: 0 14px 40px rgba(0,0,0,.18);
       overflow:hidden;
-    }}
-    .head {{
+    }
+    .head {
       padding: 26px 26px 18px;
       background: #fff;
-    }}
-    .pill {{
+    }
+    .pill {
       display:inline-flex; align-items:center; gap:10px;
       background: var(--yellow);
       color: var(--ink);
@@ -143,35 +105,35 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       border-radius: 14px;
       padding: 10px 14px;
       border: 3px solid rgba(11,78,219,.18);
-    }}
-    .pill .dot {{
+    }
+    .pill .dot {
       width:28px;height:28px;border-radius:10px;
       background: var(--blue);
       color:#fff; display:flex; align-items:center; justify-content:center;
       font-weight:900;
-    }}
-    h1 {{
+    }
+    h1 {
       margin:16px 0 0;
       font-size: 34px;
       letter-spacing: -0.02em;
-    }}
-    .sub {{
+    }
+    .sub {
       margin-top:10px; color: var(--muted); font-size: 14px; line-height:1.5;
-    }}
-    .sub a {{ color: var(--blue); text-decoration: none; border-bottom:1px solid rgba(11,78,219,.25); }}
+    }
+    .sub a { color: var(--blue); text-decoration: none; border-bottom:1px solid rgba(11,78,219,.25); }
 
-    .grid {{
+    .grid {
       padding: 18px 26px 26px;
       background: var(--panel);
       display: grid;
       grid-template-columns: 1fr;
       gap: 14px;
-    }}
-    @media (min-width: 900px) {{
-      .grid {{ grid-template-columns: 1fr 1fr; }}
-    }}
+    }
+    @media (min-width: 900px) {
+      .grid { grid-template-columns: 1fr 1fr; }
+    }
 
-    .card {{
+    .card {
       --cat: var(--etc);
       display:block;
       text-decoration:none;
@@ -183,30 +145,30 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       box-shadow: 0 10px 20px rgba(10,27,61,.06);
       transition: transform .08s ease, box-shadow .12s ease, border-color .12s ease;
       border-left: 10px solid var(--cat);
-    }}
-    .card:hover {{
+    }
+    .card:hover {
       transform: translateY(-2px);
       box-shadow: 0 14px 26px rgba(10,27,61,.12);
       border-color: rgba(11,78,219,.25);
-    }}
+    }
 
     /* category color binding */
-    .cat-cathode {{ --cat: var(--cathode); }}
-    .cat-anode {{ --cat: var(--anode); }}
-    .cat-electrolyte {{ --cat: var(--electrolyte); }}
-    .cat-separator {{ --cat: var(--separator); }}
-    .cat-solid_state {{ --cat: var(--solid); }}
-    .cat-sodium {{ --cat: var(--sodium); }}
-    .cat-recycling {{ --cat: var(--recycling); }}
-    .cat-equipment {{ --cat: var(--equipment); }}
-    .cat-policy {{ --cat: var(--policy); }}
-    .cat-etc {{ --cat: var(--etc); }}
-
-    .cardTop {{
+    .cat-cathode { --cat: var(--cathode); }
+    .cat-anode { --cat: var(--anode); }
+    .cat-electrolyte { --cat: var(--electrolyte); }
+    .cat-separator { --cat: var(--separator); }
+    .cat-solid_state { --cat: var(--solid); }
+    .cat-sodium { --cat: var(--sodium); }
+    .cat-recycling { --cat: var(--recycling); }
+    .cat-equipment { --cat: var(--equipment); }
+    .cat-policy { --cat: var(--policy); }
+    .cat-etc { --cat: var(--etc); }
+
+    .cardTop {
       display:flex; align-items:flex-start; justify-content:space-between; gap:10px;
       margin-bottom: 10px;
-    }}
-    .num {{
+    }
+    .num {
       width:44px;height:44px;border-radius:14px;
       background: var(--blue);
       color:#fff;
@@ -214,13 +176,13 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       font-weight: 900;
       letter-spacing:.02em;
       flex: 0 0 auto;
-    }}
-    .badgeRow {{
+    }
+    .badgeRow {
       flex:1;
       display:flex; align-items:center; justify-content:space-between; gap:10px;
       padding-top: 2px;
-    }}
-    .badge {{
+    }
+    .badge {
       display:inline-flex;
       padding: 6px 10px;
       background: color-mix(in srgb, var(--cat) 14%, white);
@@ -229,27 +191,27 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       font-weight: 900;
       font-size: 12px;
       border: 1px solid color-mix(in srgb, var(--cat) 22%, white);
-    }}
-    .meta {{
+    }
+    .meta {
       color: var(--muted);
       font-size: 12px;
       white-space: nowrap;
       font-weight: 800;
-    }}
-    .title {{
+    }
+    .title {
       font-size: 16px;
       font-weight: 900;
       line-height: 1.35;
       letter-spacing: -0.01em;
       margin-bottom: 10px;
-    }}
-
-    .rows {{ margin-top: 8px; display: grid; gap: 8px; }}
-    .row {{ display:flex; gap:10px; align-items:flex-start; }}
-    .k {{ width:64px; flex:0 0 auto; font-size:12px; color: var(--muted); font-weight:900; }}
-    .v {{ flex:1; font-size:13px; color:#223253; line-height:1.35; }}
-    .chips {{ display:flex; flex-wrap:wrap; gap:6px; }}
-    .chip {{
+    }
+
+    .rows { margin-top: 8px; display: grid; gap: 8px; }
+    .row { display:flex; gap:10px; align-items:flex-start; }
+    .k { width:64px; flex:0 0 auto; font-size:12px; color: var(--muted); font-weight:900; }
+    .v { flex:1; font-size:13px; color:#223253; line-height:1.35; }
+    .chips { display:flex; flex-wrap:wrap; gap:6px; }
+    .chip {
       display:inline-flex; align-items:center;
       padding:6px 10px;
       border-radius:999px;
@@ -258,42 +220,42 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       color:#0B4EDB;
       font-weight:900;
       font-size:12px;
-    }}
-    .chip.muted {{
+    }
+    .chip.muted {
       background: #f2f4f8;
       color:#6b7280;
       border-color:#e5e7eb;
-    }}
+    }
 
-    .summaryBox {{
+    .summaryBox {
       margin-top: 12px;
       padding: 10px 12px;
       border-radius: 14px;
       border: 1px solid var(--line);
       background: #fff;
-    }}
-    .summaryTitle {{
+    }
+    .summaryTitle {
       font-size: 12px;
       font-weight: 900;
       color: var(--muted);
       margin-bottom: 6px;
-    }}
-    .summary {{
+    }
+    .summary {
       margin: 0;
       padding-left: 18px;
       color: #223253;
       font-size: 13px;
       line-height: 1.5;
-    }}
-    .footer {{
+    }
+    .footer {
       margin-top: 12px;
       display:flex; justify-content:flex-end;
       color: var(--muted);
       font-size: 12px;
       font-weight: 800;
-    }}
+    }
 
-    .bottom {{
+    .bottom {
       padding: 14px 26px 20px;
       background: #fff;
       border-top: 1px solid var(--line);
@@ -301,23 +263,33 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
       color: var(--muted);
       font-size: 12px;
       font-weight: 800;
-    }}
-    .bottom a {{ color: var(--blue); text-decoration:none; border-bottom:1px solid rgba(11,78,219,.25); }}
-  </style>
+    }
+    .bottom a { color: var(--blue); text-decoration:none; border-bottom:1px solid rgba(11,78,219,.25); }
+"""
+
+_PAGE_HEAD = Template("""<!doctype html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>배터리 카드뉴스 - $date_str</title>
+  <link rel="stylesheet" href="../$css_href">
 </head>
 <body>
   <div class="wrap">
     <div class="frame">
       <div class="head">
         <div class="pill"><span class="dot">N</span> 오늘의 배터리 카드뉴스</div>
-        <h1>{date_str} 전날 뉴스 TOP</h1>
+        <h1>$date_str 전날 뉴스 TOP</h1>
         <div class="sub">
           카드 클릭 시 원문이 새 탭에서 열립니다. · <a href="../">전체 아카이브</a>
         </div>
       </div>
 
       <div class="grid">
-        {''.join(cards_html)}
+        """)
+
+_PAGE_TAIL = """
       </div>
 
       <div class="bottom">
@@ -329,36 +301,20 @@ def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path)
 </body>
 </html>
 """
-    out_path = day_dir / "index.html"
-    out_path.write_text(html_text, encoding="utf-8")
-    return out_path
-
-
-def build_root_index(docs_dir: Path) -> Path:
-    dates = []
-    for p in docs_dir.iterdir():
-        if p.is_dir() and (p / "index.html").exists():
-            dates.append(p.name)
-    dates.sort(reverse=True)
 
-    items = "\n".join(
-        f'<li style="margin:10px 0;"><a style="color:#0B4EDB;text-decoration:none;border-bottom:1px solid rgba(11,78,219,.25);" href="{_e(d)}/">{_e(d)}</a></li>'
-        for d in dates
-    )
-
-    html_text = f"""<!doctype html>
+_ROOT_HEAD = """<!doctype html>
 <html lang="ko">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>배터리 카드뉴스 아카이브</title>
   <style>
-    body {{ margin:0; font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, sans-serif; background:#0B4EDB; }}
-    .wrap {{ max-width: 900px; margin: 0 auto; padding: 28px 16px 60px; }}
-    .box {{ background:#fff; border-radius:22px; padding: 22px 22px 26px; box-shadow: 0 14px 40px rgba(0,0,0,.18); border: 6px solid rgba(255,255,255,.25); }}
-    h1 {{ margin:0 0 8px; color:#0A1B3D; font-size: 22px; }}
-    p {{ margin:0 0 16px; color:#5B6B88; }}
-    ul {{ margin:0; padding-left: 18px; }}
+    body { margin:0; font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, sans-serif; background:#0B4EDB; }
+    .wrap { max-width: 900px; margin: 0 auto; padding: 28px 16px 60px; }
+    .box { background:#fff; border-radius:22px; padding: 22px 22px 26px; box-shadow: 0 14px 40px rgba(0,0,0,.18); border: 6px solid rgba(255,255,255,.25); }
+    h1 { margin:0 0 8px; color:#0A1B3D; font-size: 22px; }
+    p { margin:0 0 16px; color:#5B6B88; }
+    ul { margin:0; padding-left: 18px; }
   </style>
 </head>
 <body>
@@ -366,12 +322,203 @@ def build_root_index(docs_dir: Path) -> Path:
     <div class="box">
       <h1>배터리 카드뉴스 아카이브</h1>
       <p>날짜를 클릭하면 해당 날짜 카드뉴스 페이지로 이동합니다.</p>
-      <ul>{items}</ul>
+      <ul>"""
+
+_ROOT_ROW = Template(
+    '<li style="margin:10px 0;"><a style="color:#0B4EDB;text-decoration:none;'
+    'border-bottom:1px solid rgba(11,78,219,.25);" href="$date/">$date</a></li>'
+)
+
+_ROOT_TAIL = """</ul>
     </div>
   </div>
 </body>
 </html>
 """
+
+
+_ESCAPE_RE = re.compile(r"[&<>\"']")
+# html.escape(quote=True)와 같은 치환을 한 번의 translate 패스로
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
+# source / category / company / date strings repeat across cards and days
+@lru_cache(maxsize=4096)
+def _e(s: str) -> str:
+    if not s:
+        return ""
+    # most Korean titles carry no HTML metacharacters; return them untouched
+    if _ESCAPE_RE.search(s) is None:
+        return s
+    return s.translate(_ESCAPE_TABLE)
+
+
+_CAT_MAP = {
+    sys.intern(k): v
+    for k, v in {
+        "cathode": "cathode",
+        "anode": "anode",
+        "electrolyte": "electrolyte",
+        "separator": "separator",
+        "전고체": "solid_state",
+        "나트륨": "sodium",
+        "재활용": "recycling",
+        "장비": "equipment",
+        "정책": "policy",
+        "기타": "etc",
+    }.items()
+}
+_cat_get = _CAT_MAP.get
+
+
+def _cat_slug(cat: str) -> str:
+    return _cat_get(cat, "etc")
+
+
+# 이 프로세스에서 이미 만든 디렉터리 (mkdir 재호출 생략)
+_DIR_CACHE: set[Path] = set()
+
+
+def _ensure_dir(p: Path) -> None:
+    if p in _DIR_CACHE:
+        return
+    p.mkdir(parents=True, exist_ok=True)
+    _DIR_CACHE.add(p)
+
+
+def _ensure_css(docs_dir: Path) -> Path:
+    # 내용이 바뀐 경우에만 다시 쓴다 (작은 파일이라 바이트를 그대로 비교)
+    css_path = docs_dir / _CSS_PATH
+    data = _CSS.encode("utf-8")
+    try:
+        if css_path.read_bytes() == data:
+            return css_path
+    except FileNotFoundError:
+        pass
+    _ensure_dir(css_path.parent)
+    css_path.write_bytes(data)
+    return css_path
+
+
+def _same_content(buf: io.StringIO, out_path: Path) -> bool:
+    # 기존 파일과 버퍼를 64KiB씩 비교 (파일 전체를 메모리에 올리지 않음)
+    buf.seek(0)
+    try:
+        with open(out_path, "r", encoding="utf-8", newline="") as f:
+            while True:
+                new = buf.read(1 << 16)
+                if new != f.read(len(new) or 1):
+                    return False
+                if not new:
+                    return True
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _write_buffer(buf: io.StringIO, out_path: Path) -> None:
+    # 내용이 같으면 쓰지 않는다(재실행 시 mtime/디스크 churn 방지)
+    if _same_content(buf, out_path):
+        return
+    # 페이지 전체를 str/bytes로 한 번에 만들지 않고 버퍼에서 바로 흘려 쓴다
+    buf.seek(0)
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        shutil.copyfileobj(buf, f)
+
+
+def build_daily_page(date_str: str, items: list[dict[str, Any]], docs_dir: Path, ensure_css: bool = True) -> Path:
+    day_dir = docs_dir / date_str
+    _ensure_dir(day_dir)
+    if ensure_css:
+        _ensure_css(docs_dir)
+
+    buf = io.StringIO()
+    buf.write(_PAGE_HEAD.substitute(date_str=date_str, css_href=_CSS_PATH))
+
+    # 카드 루프에서 쓰는 전역/메서드 조회를 지역 변수로 끌어올림
+    esc = _e
+    write = buf.write
+    render_card = _CARD_TMPL.substitute
+    for i, it in enumerate(items, 1):
+        get = it.get
+        title = esc(get("title", ""))
+        link = esc(get("link", ""))
+        source = esc(get("source", ""))
+        category_raw = get("category", "기타")
+        category = esc(category_raw)
+        tier = esc(str(get("tier", 3)))
+        pub = esc(get("published_at", date_str))
+
+        chips = ['<span class="chip">' + esc(c) + "</span>" for c in (get("companies", []) or [])]
+        comp_html = "".join(chips) if chips else '<span class="chip muted">-</span>'
+
+        summ = (get("summary_3_sentences") or [])[:3]
+        summ += [""] * (3 - len(summ))
+        summ_html = "".join(["<li>" + esc(s) + "</li>" for s in summ if s])
+
+        cat_class = "cat-" + _cat_slug(category_raw)
+
+        write(
+            render_card(
+                cat_class=cat_class,
+                link=link,
+                num=f"{i:02d}",
+                category=category,
+                tier=tier,
+                title=title,
+                source=source,
+                comp_html=comp_html,
+                summ_html=summ_html,
+                pub=pub,
+            )
+        )
+
+    buf.write(_PAGE_TAIL)
+    out_path = day_dir / "index.html"
+    _write_buffer(buf, out_path)
+    return out_path
+
+
+def build_root_index(docs_dir: Path) -> Path:
+    dates = []
+    with os.scandir(docs_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "index.html")):
+                dates.append(entry.name)
+    dates.sort(reverse=True)
+
+    # 날짜 목록(+템플릿)이 그대로면 index.html 재작성 생략
     out_path = docs_dir / "index.html"
-    out_path.write_text(html_text, encoding="utf-8")
+    state = hashlib.sha1("\n".join([_ROOT_HEAD, _ROOT_ROW.template, _ROOT_TAIL, *dates]).encode("utf-8")).hexdigest()
+    state_path = docs_dir / ".index_state"
+    if out_path.exists() and state_path.exists() and state_path.read_text(encoding="utf-8") == state:
+        return out_path
+
+    buf = io.StringIO()
+    buf.write(_ROOT_HEAD)
+    for n, d in enumerate(dates):
+        if n:
+            buf.write("\n")
+        buf.write(_ROOT_ROW.substitute(date=_e(d)))
+    buf.write(_ROOT_TAIL)
+    _write_buffer(buf, out_path)
+    state_path.write_text(state, encoding="utf-8")
     return out_path
+
+
+def _build_one(args: tuple[str, list[dict[str, Any]], Path]) -> Path:
+    date_str, items, docs_dir = args
+    # cards.css는 build_all_days가 풀 시작 전에 한 번만 확인한다
+    return build_daily_page(date_str, items, docs_dir, ensure_css=False)
+
+
+def build_all_days(pairs: list[tuple[str, list[dict[str, Any]]]], docs_dir: Path, max_workers: int | None = None) -> list[Path]:
+    """
+    아카이브 전체 재생성용: 날짜별 페이지를 프로세스 풀에서 병렬로 만든다.
+    pairs: [(date_str, items), ...]  (루트 index는 호출자가 build_root_index로 갱신)
+    """
+    _ensure_css(docs_dir)
+    jobs = [(d, items, docs_dir) for d, items in pairs]
+    if len(jobs) <= 1:
+        return [_build_one(j) for j in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(_build_one, jobs))
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+from .ranker import infer_tier
+from .utils import split_sentences, squash_ws
 
 
 CATEGORIES = [
@@ -17,51 +24,183 @@ CATEGORIES = [
 ]
 
 
-def classify_category(title: str, description: str) -> str:
-    text = f"{title} {description}".lower()
-    for cat, keys in CATEGORIES:
-        for k in keys:
-            if k.lower() in text:
-                return cat
-    return "기타"
+# import 시 한 번 소문자화해 고정: ((cat, (lower_key, ...)), ...), 카테고리 이름은 intern
+_CATEGORY_KEYS = tuple((sys.intern(cat), tuple(dict.fromkeys(k.lower() for k in keys))) for cat, keys in CATEGORIES)
 
+# 전체 키워드를 하나의 정규식으로: 카테고리마다 그룹 하나, 그룹 순서 = CATEGORIES 우선순위.
+# lookahead라 겹치는 매치도 모든 위치에서 잡히고, 같은 위치에서는 앞선 카테고리가 이긴다.
+_CAT_NAMES = tuple(cat for cat, _ in _CATEGORY_KEYS)
+# 키워드 첫 글자 집합: 텍스트에 하나도 없으면 어떤 키워드도 매치될 수 없다
+_FIRST_CHARS = frozenset(k[0] for _, keys in _CATEGORY_KEYS for k in keys)
+_CAT_UNION_RE = re.compile(
+    "(?="
+    + "|".join("(" + "|".join(map(re.escape, keys)) + ")" for _, keys in _CATEGORY_KEYS)
+    + ")"
+)
 
-def extract_companies(title: str, description: str, max_n: int = 3) -> list[str]:
-    text = f"{title} {description}".lower()
-    p = Path("config/companies.txt")
-    if not p.exists():
+
+def _lowered_text(title: str, description: str) -> str:
+    return f"{title} {description}".lower()
+
+
+# 통신사 기사/재배포 기사로 같은 제목+본문이 하루에도 여러 번 들어온다
+@lru_cache(maxsize=2048)
+def _classify_from_lowered(text: str) -> str:
+    if _FIRST_CHARS.isdisjoint(text):
+        return "기타"
+    best = len(_CAT_NAMES)
+    for m in _CAT_UNION_RE.finditer(text):
+        rank = m.lastindex - 1
+        if rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return _CAT_NAMES[best] if best < len(_CAT_NAMES) else "기타"
+
+
+COMPANIES_PATH = Path("config/companies.txt")
+
+
+_CompanyMatcher = tuple[tuple[str, ...], re.Pattern[str] | None, dict[str, tuple[str, ...]]]
+_EMPTY_MATCHER: _CompanyMatcher = ((), None, {})
+
+# (st_mtime_ns, matcher): 파일이 바뀔 때만 다시 읽는다
+_companies_cache: tuple[int, _CompanyMatcher] | None = None
+
+
+def _build_company_matcher(raw: str) -> _CompanyMatcher:
+    """
+    (파일 순서 이름들, 합친 정규식, 접두 이름 맵).
+    정규식은 긴 이름부터 lookahead로 나열해 각 위치에서 가장 긴 이름을 잡고,
+    그 이름의 접두어인 다른 이름들도 같은 위치에 있으므로 함께 매치로 친다.
+    """
+    names = tuple(
+        name
+        for name in (line.strip() for line in raw.splitlines())
+        if name and not name.startswith("#")
+    )
+    alts = sorted({n.lower() for n in names}, key=len, reverse=True)
+    if not alts:
+        return names, None, {}
+    pattern = re.compile("(?=(" + ")|(".join(re.escape(a) for a in alts) + "))")
+    implied = {a: tuple(b for b in alts if a.startswith(b)) for a in alts}
+    return names, pattern, implied
+
+
+def _company_matcher() -> _CompanyMatcher:
+    global _companies_cache
+    try:
+        mtime = COMPANIES_PATH.stat().st_mtime_ns
+    except OSError:
+        return _EMPTY_MATCHER
+    if _companies_cache is None or _companies_cache[0] != mtime:
+        _companies_cache = (mtime, _build_company_matcher(COMPANIES_PATH.read_text(encoding="utf-8")))
+    return _companies_cache[1]
+
+
+def _companies_from_lowered(text: str, max_n: int) -> list[str]:
+    names, pattern, implied = _company_matcher()
+    if pattern is None:
         return []
+    hits: set[str] = set()
+    for m in pattern.finditer(text):
+        hits.update(implied[m.group(m.lastindex)])
+
+    # 결과 순서는 기존처럼 파일 순서
     found: list[str] = []
-    for line in p.read_text(encoding="utf-8").splitlines():
-        name = line.strip()
-        if not name or name.startswith("#"):
-            continue
-        if name.lower() in text and name not in found:
+    for name in names:
+        if name.lower() in hits and name not in found:
             found.append(name)
-        if len(found) >= max_n:
-            break
+            if len(found) >= max_n:
+                break
     return found
 
+
+def classify_category(title: str, description: str) -> str:
+    return _classify_from_lowered(_lowered_text(title, description))
+
+
+def classify_categories(titles: Sequence[str], descriptions: Sequence[str]) -> list[str]:
+    """
+    배치 분류: 전체 기사를 구분자(\x01)로 이어 붙여 union 정규식을 한 번만 돌리고,
+    매치 위치를 bisect로 기사 인덱스에 되돌린다. 결과는 입력 순서와 같다.
+    (키워드에 \x01이 없으므로 매치가 기사 경계를 넘지 않는다)
+    """
+    texts = [_lowered_text(t, d) for t, d in zip(titles, descriptions)]
+    starts: list[int] = []
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text) + 1
+
+    n_cats = len(_CAT_NAMES)
+    best = [n_cats] * len(texts)
+    for m in _CAT_UNION_RE.finditer("\x01".join(texts)):
+        i = bisect_right(starts, m.start()) - 1
+        rank = m.lastindex - 1
+        if rank < best[i]:
+            best[i] = rank
+    return [_CAT_NAMES[b] if b < n_cats else "기타" for b in best]
+
+
+def classify_batch(items: Iterable[Mapping[str, Any]]) -> list[str]:
+    """
+    items(dict 목록) 전체 분류 (classify_categories 래퍼).
+    """
+    items = list(items)
+    return classify_categories(
+        [it.get("title", "") for it in items],
+        [it.get("description", "") for it in items],
+    )
+
+
+def extract_companies(title: str, description: str, max_n: int = 3) -> list[str]:
+    return _companies_from_lowered(_lowered_text(title, description), max_n)
+
+
+def tag_article(title: str, description: str, max_companies: int = 3) -> tuple[str, list[str]]:
+    """
+    (category, companies): title+description을 한 번만 합치고 소문자화해 두 매처가 공유한다.
+    """
+    text = _lowered_text(title, description)
+    return _classify_from_lowered(text), _companies_from_lowered(text, max_companies)
+
+
+def tag_item(it: dict[str, Any], sources_config: Mapping[str, Any], max_companies: int = 3) -> dict[str, Any]:
+    """
+    tier/category/companies in one pass (category/companies via tag_article).
+    """
+    category, companies = tag_article(it.get("title", ""), it.get("description", ""), max_companies)
+    return {
+        "tier": infer_tier(it.get("link", ""), sources_config),
+        "category": category,
+        "companies": companies,
+    }
+
 def fallback_summary_3_sentences_from_description(title: str, description: str) -> list[str]:
     """
     템플릿 금지. description에서 문장 3개를 최대한 뽑는다.
     문장이 부족하면 description을 길이로 3등분해 문장처럼 만든다(내용 기반).
     """
-    import re
-    desc = re.sub(r"\s+", " ", (description or "")).strip()
+    # 캐시는 tuple로 들고 있고, 호출자가 수정해도 되도록 매번 새 list를 돌려준다
+    return list(_fallback_summary_cached(title, description))
+
+
+@lru_cache(maxsize=2048)
+def _fallback_summary_cached(title: str, description: str) -> tuple[str, ...]:
+    desc = squash_ws(description)
 
     # 1) 문장 분리 시도
-    parts = re.split(r"(?<=[\.\!\?])\s+|(?<=다\.)\s+|(?<=요\.)\s+", desc)
-    parts = [p.strip() for p in parts if p.strip()]
+    parts = split_sentences(desc)
 
     if len(parts) >= 3:
-        return parts[:3]
+        return tuple(parts[:3])
 
     # 2) 문장이 부족하면 내용 기반 chunking
     base = desc if desc else title
     base = base.strip()
     if not base:
-        return ["", "", ""]
+        return ("", "", "")
 
     # 길이 기준 3등분
     n = len(base)
@@ -81,4 +220,4 @@ def fallback_summary_3_sentences_from_description(title: str, description: str)
     out = [enddot(s1), enddot(s2), enddot(s3)]
     while len(out) < 3:
         out.append("")
-    return out[:3]
+    return tuple(out[:3])
@@ -2,48 +2,112 @@ from __future__ import annotations
 
 import os
 import re
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+from urllib.parse import ParseResult, parse_qsl, urlencode, urlparse, urlunparse
 
 
 KST = ZoneInfo("Asia/Seoul")
 
+_TRACK_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+# k=v 쌍이 전부 quote_plus의 안전 문자(영숫자 _.-~)뿐인 쿼리: parse_qsl→urlencode 왕복이 항등이므로 생략 가능
+_PLAIN_QUERY_RE = re.compile(r"[\w.~-]+=[\w.~-]*(?:&[\w.~-]+=[\w.~-]*)*", re.ASCII)
+_UNSAFE_CHARS = frozenset('\\/:*?"<>|')
+_UNSAFE_RE = re.compile(r"[\\/:*?\"<>|]+")
+_WS_RE = re.compile(r"\s+")
+# squash_ws를 거친 텍스트 전용: 공백은 단일 " "뿐이고 "다."/"요."는 [.!?]에 포함되므로
+# (?<=[\.\!\?])\s+|(?<=다\.)\s+|(?<=요\.)\s+ 와 같은 결과를 더 싼 패턴으로 얻는다
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?]) ")
+
+
+# (epoch minute, (today, yesterday)). KST는 정시 오프셋이라 자정은 항상 분 경계 →
+# 같은 분 안에서는 날짜가 바뀌지 않으므로 분 단위로 캐시해도 정확하다.
+_KST_DATES: tuple[int, tuple[str, str]] = (-1, ("", ""))
+
+
+def _kst_dates() -> tuple[str, str]:
+    global _KST_DATES
+    ts = time.time()
+    minute = int(ts // 60)
+    if _KST_DATES[0] != minute:
+        today = datetime.fromtimestamp(ts, tz=KST).date()
+        _KST_DATES = (minute, (today.isoformat(), (today - timedelta(days=1)).isoformat()))
+    return _KST_DATES[1]
+
 
 def kst_today_date_str() -> str:
-    return datetime.now(tz=KST).date().isoformat()
+    return _kst_dates()[0]
 
 
 def kst_yesterday_date_str() -> str:
-    return (datetime.now(tz=KST).date() - timedelta(days=1)).isoformat()
+    return _kst_dates()[1]
+
+
+# normalize_url/domain_of가 같은 URL을 연달아 파싱하므로 결과(불변 namedtuple)를 공유
+@lru_cache(maxsize=4096)
+def _parse(url: str) -> ParseResult:
+    return urlparse(url)
+
+
+def _is_tracking_key(key: str) -> bool:
+    key = key.lower()
+    return key.startswith("utm_") or key in _TRACK_PARAMS
 
 
 def normalize_url(url: str) -> str:
-    """Remove common tracking parameters and normalize URL."""
+    """
+    Remove common tracking parameters and normalize URL.
+    Plain queries (see _PLAIN_QUERY_RE) are filtered as text; anything else is re-encoded
+    through parse_qsl/urlencode. Both give the same result.
+    """
     if not url:
         return url
     try:
-        p = urlparse(url)
-        q = [(k, v) for (k, v) in parse_qsl(p.query, keep_blank_values=True)
-             if not k.lower().startswith("utm_")
-             and k.lower() not in {"fbclid", "gclid", "mc_cid", "mc_eid"}]
-        new_query = urlencode(q, doseq=True)
-        return urlunparse((p.scheme, p.netloc, p.path, p.params, new_query, p.fragment))
+        p = _parse(url)
+        query = p.query
+        if _PLAIN_QUERY_RE.fullmatch(query):
+            query = "&".join(pair for pair in query.split("&") if not _is_tracking_key(pair.partition("=")[0]))
+        elif query:
+            q = [(k, v) for (k, v) in parse_qsl(query, keep_blank_values=True) if not _is_tracking_key(k)]
+            query = urlencode(q, doseq=True)
+        return urlunparse((p.scheme, p.netloc, p.path, p.params, query, p.fragment))
     except Exception:
         return url
 
 
 def domain_of(url: str) -> str:
     try:
-        return urlparse(url).netloc.lower()
+        return _parse(url).netloc.lower()
     except Exception:
         return ""
 
 
+def squash_ws(text: str) -> str:
+    """Collapse whitespace runs to one space and strip (same as _WS_RE.sub(" ", text).strip())."""
+    # 대부분의 description은 이미 깔끔하다: 공백 외 whitespace도, 연속 공백도 없으면 정규식 생략
+    # (isprintable()은 ASCII space를 제외한 모든 whitespace에서 False)
+    text = (text or "").strip()
+    if text.isprintable() and "  " not in text:
+        return text
+    return _WS_RE.sub(" ", text)
+
+
+def split_sentences(text: str) -> list[str]:
+    """Whitespace-normalize, then split after . ! ? (incl. 다./요.); empty parts dropped."""
+    text = squash_ws(text)
+    if not text:
+        return []
+    return [p.strip() for p in _SENT_SPLIT_RE.split(text) if p.strip()]
+
+
 def safe_filename(name: str) -> str:
-    name = re.sub(r"[\\/:*?\"<>|]+", "_", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    # 대부분의 이름엔 금지 문자가 없다: set 교집합 검사(C 루프)로 정규식 치환을 건너뜀
+    if not _UNSAFE_CHARS.isdisjoint(name):
+        name = _UNSAFE_RE.sub("_", name)
+    name = _WS_RE.sub(" ", name).strip()
     return name
 
 
@@ -57,7 +121,7 @@ def getenv_int(key: str, default: int) -> int:
         return default
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewsItem:
     title: str
     published_at: str  # YYYY-MM-DD